@@ -1,5 +1,6 @@
 from collections.abc import Mapping, MutableSequence
 from numbers import Number
+import unicodedata
 
 
 def is_list(x):
@@ -20,3 +21,19 @@ def is_and_logic(level):
     # Level of nesting of the group pattern-action specifier
     # defines whether pattern masks are grouped with AND logic.
     return not level % 2
+
+
+def strip_accents(text):
+    # Same approach as strip_accents='unicode' of scikit-learn vectorizers
+    if not isinstance(text, str):
+        return text
+    decomposed = unicodedata.normalize('NFKD', text)
+    if decomposed == text:  # nothing to strip
+        return text
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def collapse_spaces(text):
+    if not isinstance(text, str):
+        return text
+    return ' '.join(text.split())
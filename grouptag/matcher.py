@@ -1,5 +1,7 @@
 import pandas as pd
-from .common import is_dict, is_list, is_and_logic
+from .common import (is_dict, is_list, is_and_logic,
+                     strip_accents, collapse_spaces)
+from .settings import patterns_normalize_keys
 from .explain import explain
 
 
@@ -82,9 +84,11 @@ class AtomicMatcher:
                 break
         else:
             pattern, action_spec = spec, None
-        # Need to lowercase the pattern?
-        if self.settings.get('patterns.lower', False):
-            pattern = get_lower_pattern(pattern)
+        # Need to lowercase or otherwise normalize the pattern?
+        for key in patterns_normalize_keys:
+            if self.settings.get(key, False):
+                transform = _pattern_transforms[key]
+                pattern = get_normalized_pattern(pattern, transform)
         action = self.settings.get_action(action_spec, pattern)
         if is_dict(action):
             action = _check_action(action)
@@ -93,11 +97,19 @@ class AtomicMatcher:
         return pattern, action
 
 
-def get_lower_pattern(pattern):
+_pattern_transforms = {
+    'patterns.lower': str.lower,
+    'patterns.strip_accents': strip_accents,
+    'patterns.collapse_spaces': collapse_spaces
+}
+
+
+def get_normalized_pattern(pattern, transform):
     if isinstance(pattern, str):
-        result = pattern.lower()
+        result = transform(pattern)
     elif isinstance(pattern, (list, tuple, set)):
-        result = pattern.__class__(get_lower_pattern(ptn) for ptn in pattern)
+        result = pattern.__class__(get_normalized_pattern(ptn, transform)
+                                   for ptn in pattern)
     else:
         result = pattern
     return result
@@ -4,7 +4,18 @@ from .common import is_dict, is_numeric
 NEG_PFX = '~'  # Prefix to indicate negation of a method
 NOARGS_SFX = '()'  # Suffix to indicate that method takes no arguments
 DEFAULT_ACTION_KEY = None
-preprocessing_keys = {'series.lower', 'patterns.lower'}
+# Series preprocessing settings and the text view transform each one enables,
+# in the order the transforms are applied
+series_view_keys = {
+    'series.lower': 'lower',
+    'series.strip_accents': 'strip_accents',
+    'series.collapse_spaces': 'collapse_spaces'
+}
+# Pattern preprocessing settings, same transforms and order as for series
+patterns_normalize_keys = (
+    'patterns.lower', 'patterns.strip_accents', 'patterns.collapse_spaces'
+)
+preprocessing_keys = {*patterns_normalize_keys, *series_view_keys}
 
 
 _default_settings = {
@@ -37,6 +48,11 @@ class Settings(collections.UserDict):
             if key not in preprocessing_keys:
                 self.actions[key] = _parse_action(value)
 
+    def get_view_key(self):
+        # Key of the normalized text view of the series the rules match against
+        return tuple(view for key, view in series_view_keys.items()
+                     if self.get(key, False))
+
     def get_action(self, spec=None, pattern=None):
         _default = self.actions.get(DEFAULT_ACTION_KEY)
         if spec is None:  # by pattern class name
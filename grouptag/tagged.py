@@ -1,11 +1,40 @@
 from collections.abc import MutableSequence
 import pandas as pd
+from .common import strip_accents
+
+
+_view_transforms = {
+    'lower': lambda series: series.str.lower(),
+    'strip_accents': lambda series: series.map(strip_accents),
+    'collapse_spaces': lambda series: series.str.split().str.join(' ')
+}
+
+
+def get_view_prefixes(key):
+    # Views needed to serve the key: the key and every non-empty prefix,
+    # since a view is built from the longest cached prefix of its key.
+    return {key[:n] for n in range(1, len(key) + 1)}
+
+
+def get_needed_views(view_keys):
+    # Views still needed from each position of the chain of view keys onward.
+    # Computed in one reverse pass; positions with the same needs share
+    # the same set object, so a change of needs is a change of identity.
+    needed_views, needed = [], frozenset()
+    for key in reversed(view_keys):
+        prefixes = get_view_prefixes(key)
+        if not prefixes <= needed:
+            needed = needed | prefixes
+        needed_views.append(needed)
+    needed_views.reverse()
+    return needed_views
 
 
 class TaggedSeries:
     def __init__(self, series, prefill):
-        self._use_lowercase = False
-        self._cached_lower = None
+        self._view_key = ()
+        self._views = {}  # Normalized text views keyed by tuple of transforms
+        self._needed_views = frozenset()  # Views worth keeping once built
         self._series = series
         self.untagged_index = self._series.index
         self.tagged_index = pd.Index([])
@@ -17,9 +46,13 @@ class TaggedSeries:
 
     @property
     def series(self):
-        if self._cached_lower is None and self._use_lowercase:
-            self._cached_lower = self._series.str.lower()
-        return self._cached_lower if self._use_lowercase else self._series
+        # Normalized views are built lazily and cover the rows that were
+        # untagged at the time, which is always a superset of untagged rows.
+        if not self._view_key:
+            return self._series
+        if self._view_key not in self._views:
+            self._views[self._view_key] = self._build_view(self._view_key)
+        return self._views[self._view_key]
 
     @property
     def untagged(self):
@@ -29,10 +62,35 @@ class TaggedSeries:
     def tag(self):
         return self._series_tag
 
-    def use_lowercase(self, flag):
-        self._use_lowercase = True if flag else False
+    def use_view(self, key):
+        self._view_key = tuple(key)
+        return self
+
+    def release_views(self, keep=frozenset()):
+        # Drop cached views that no later rule is going to use or build from,
+        # keep is a set of views as computed by get_needed_views()
+        self._needed_views = keep
+        self._views = {k: v for k, v in self._views.items()
+                       if k in self._needed_views}
         return self
 
+    def _build_view(self, key):
+        # Start from the longest cached view that is a prefix of the key
+        # so that shared transforms are not repeated. Intermediate views
+        # are cached too when later rules need them.
+        start, view = 0, self._series
+        for n in range(len(key) - 1, 0, -1):
+            if key[:n] in self._views:
+                start, view = n, self._views[key[:n]]
+                break
+        if view.size != self.untagged_index.size:  # some rows got tagged
+            view = view[self.untagged_index]
+        for n in range(start + 1, len(key) + 1):
+            view = _view_transforms[key[n - 1]](view)
+            if key[:n] in self._needed_views:
+                self._views[key[:n]] = view
+        return view
+
     def __setitem__(self, key, value):
         # Only untagged items may be tagged.
         # Boolean key index should match the size of untagged index.
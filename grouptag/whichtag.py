@@ -2,7 +2,7 @@ import pandas as pd
 from .common import is_dict, is_list
 from .settings import Settings
 from .matcher import get_matcher
-from .tagged import TaggedSeries
+from .tagged import TaggedSeries, get_needed_views
 from .explain import explain
 
 # Join logic for the group of top-level pattern masks is 'AND'
@@ -40,10 +40,11 @@ class PatternTagger:
         self.log = {}
         self.rules_spec = rules
         self.rule_chain = []
-        # Set chain of Rules
+        # Set chain of Rules, rules between settings changes share settings
         settings = Settings()
         for rule_spec in self.rules_spec:
             if is_dict(rule_spec):
+                settings = settings.copy()
                 settings.update(rule_spec)
             else:
                 self.rule_chain.append(Rule(rule_spec, settings))
@@ -51,10 +52,17 @@ class PatternTagger:
     def __call__(self, series, prefill):
         # TODO: Fix the case of non-unique index
         tagged_series = TaggedSeries(series, prefill)
-        for rule in self.rule_chain:
+        needed_views = get_needed_views(
+            [rule.view_key for rule in self.rule_chain])
+        keep = None
+        for rule, rule_needed_views in zip(self.rule_chain, needed_views):
             if tagged_series.untagged_index.empty:
                 break
+            if rule_needed_views is not keep:
+                keep = rule_needed_views
+                tagged_series.release_views(keep=keep)
             tagged_series = rule(tagged_series)
+        tagged_series.release_views()
         self.log['series.size'] = series.size
         self.log['tagged'] = tagged_series.tagged_index.size
         self.log['untagged'] = tagged_series.untagged_index.size
@@ -66,7 +74,8 @@ class Rule:
     def __init__(self, rule_spec, settings):
         self.log = {'reached': False}
         self.rule_spec = rule_spec
-        self.settings = settings.copy()
+        self.settings = settings
+        self.view_key = self.settings.get_view_key()
         # Assign matcher
         if is_list(self.rule_spec):
             self.tag, *gopas = rule_spec  # Group of Pattern Action Specifiers
@@ -76,8 +85,7 @@ class Rule:
 
     def __call__(self, tagged_series: TaggedSeries):
         self.log = {'reached': True}
-        lower_setting = self.settings.get('series.lower', False)
-        untagged = tagged_series.use_lowercase(lower_setting).untagged
+        untagged = tagged_series.use_view(self.view_key).untagged
         mask = self.matcher(untagged)
         assert mask.size == tagged_series.untagged_index.size
         num_matched = mask.sum()